@@ -1,11 +1,17 @@
 import requests
 import json
 import logging
+import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration for local testing
-API_ENDPOINT_START = "http://localhost:8764/session/start"  # For creating test session
-API_ENDPOINT_STOP = "http://localhost:8764/session/stop"   # Points to mock server
-# API_ENDPOINT_STOP = "https://api.example.com/session/stop"  # For production testing
+API_BASE_URL = "http://localhost:8764"  # Points to mock server
+# API_BASE_URL = "https://api.example.com"  # For production testing
+API_ENDPOINT_START = f"{API_BASE_URL}/session/start"  # For creating test session
+API_ENDPOINT_STOP = f"{API_BASE_URL}/session/stop"
 API_KEY = "test-api-key-123"  # Matches mock server default
 
 # These will be populated by creating a real session first
@@ -13,9 +19,46 @@ test_session_id = None
 test_session_token = None
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+# Tests run concurrently, so tag each line with the test's thread name (see run_test)
+logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:[%(threadName)s] %(message)s")
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so every test reuses the same pooled keep-alive connections.
+# Both endpoints live on API_BASE_URL, so a single per-host pool is enough.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "accept": "application/json",
+    "content-type": "application/json",
+    "x-api-key": API_KEY
+})
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Error-case requests never change, so build their headers and JSON bodies once.
+# Hardcoded session values are enough here (these tests don't need a real session).
+HEADERS_BAD_KEY = MappingProxyType({"x-api-key": "INVALID_API_KEY"})
+HEADERS_NO_KEY = MappingProxyType({"x-api-key": None})  # None drops the session default
+
+PAYLOAD_PLACEHOLDER_SESSION = json.dumps({
+    "session_id": "test_session_id",
+    "session_token": "test_session_token"
+}).encode()
+PAYLOAD_MISSING_SESSION_ID = json.dumps({
+    "session_token": "test_session_token"
+}).encode()
+PAYLOAD_MISSING_SESSION_TOKEN = json.dumps({
+    "session_id": "test_session_id"
+}).encode()
+PAYLOAD_INVALID_SESSION_ID = json.dumps({
+    "session_id": "invalid_session_id_that_does_not_exist",
+    "session_token": "test_session_token"
+}).encode()
+
 
 def create_test_session():
     """Create a test session to use for stop testing"""
@@ -38,14 +81,8 @@ def create_test_session():
         }
     }
     
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "x-api-key": API_KEY
-    }
-    
     try:
-        response = requests.post(API_ENDPOINT_START, headers=headers, json=payload, timeout=30)
+        response = SESSION.post(API_ENDPOINT_START, json=payload, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
@@ -79,22 +116,14 @@ def test_session_stop_endpoint():
         "session_token": test_session_token
     }
     
-    # API key in headers for security
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "x-api-key": API_KEY
-    }
-    
     logger.info(f"Testing endpoint: {API_ENDPOINT_STOP}")
-    logger.info(f"Headers (API key masked): {dict(headers, **{'x-api-key': '***masked***'})}")
+    logger.info(f"Headers (API key masked): {dict(SESSION.headers, **{'x-api-key': '***masked***'})}")
     logger.info(f"Payload: {json.dumps(payload, indent=2)}")
     
     try:
         # Send DELETE request
-        response = requests.delete(
+        response = SESSION.delete(
             API_ENDPOINT_STOP,
-            headers=headers,
             json=payload,
             timeout=30
         )
@@ -210,21 +239,8 @@ def test_invalid_api_key():
     logger.info("\n" + "="*50)
     logger.info("Testing with invalid API key...")
     
-    # Use hardcoded values for error testing (don't need real session)
-    payload = {
-        "session_id": "test_session_id",
-        "session_token": "test_session_token"
-    }
-    
-    # Invalid API key in headers
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "x-api-key": "INVALID_API_KEY"
-    }
-    
     try:
-        response = requests.delete(API_ENDPOINT_STOP, headers=headers, json=payload, timeout=30)
+        response = SESSION.delete(API_ENDPOINT_STOP, headers=HEADERS_BAD_KEY, data=PAYLOAD_PLACEHOLDER_SESSION, timeout=30)
         logger.info(f"Response status code: {response.status_code}")
         
         if response.status_code == 401:
@@ -244,21 +260,8 @@ def test_missing_api_key():
     logger.info("\n" + "="*50)
     logger.info("Testing with missing API key header...")
     
-    # Use hardcoded values for error testing (don't need real session)
-    payload = {
-        "session_id": "test_session_id",
-        "session_token": "test_session_token"
-    }
-    
-    # Headers without API key
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json"
-        # Missing x-api-key header
-    }
-    
     try:
-        response = requests.delete(API_ENDPOINT_STOP, headers=headers, json=payload, timeout=30)
+        response = SESSION.delete(API_ENDPOINT_STOP, headers=HEADERS_NO_KEY, data=PAYLOAD_PLACEHOLDER_SESSION, timeout=30)
         logger.info(f"Response status code: {response.status_code}")
         
         if response.status_code in [401, 403]:
@@ -278,19 +281,8 @@ def test_missing_session_id():
     logger.info("\n" + "="*50)
     logger.info("Testing with missing session_id...")
     
-    # Missing session_id field
-    payload = {
-        "session_token": "test_session_token"
-    }
-    
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "x-api-key": API_KEY
-    }
-    
     try:
-        response = requests.delete(API_ENDPOINT_STOP, headers=headers, json=payload, timeout=30)
+        response = SESSION.delete(API_ENDPOINT_STOP, data=PAYLOAD_MISSING_SESSION_ID, timeout=30)
         logger.info(f"Response status code: {response.status_code}")
         
         if response.status_code == 400:
@@ -310,19 +302,8 @@ def test_missing_session_token():
     logger.info("\n" + "="*50)
     logger.info("Testing with missing session_token...")
     
-    # Missing session_token field
-    payload = {
-        "session_id": "test_session_id"
-    }
-    
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "x-api-key": API_KEY
-    }
-    
     try:
-        response = requests.delete(API_ENDPOINT_STOP, headers=headers, json=payload, timeout=30)
+        response = SESSION.delete(API_ENDPOINT_STOP, data=PAYLOAD_MISSING_SESSION_TOKEN, timeout=30)
         logger.info(f"Response status code: {response.status_code}")
         
         if response.status_code == 400:
@@ -342,19 +323,8 @@ def test_invalid_session_id():
     logger.info("\n" + "="*50)
     logger.info("Testing with invalid session_id...")
     
-    payload = {
-        "session_id": "invalid_session_id_that_does_not_exist",
-        "session_token": "test_session_token"
-    }
-    
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "x-api-key": API_KEY
-    }
-    
     try:
-        response = requests.delete(API_ENDPOINT_STOP, headers=headers, json=payload, timeout=30)
+        response = SESSION.delete(API_ENDPOINT_STOP, data=PAYLOAD_INVALID_SESSION_ID, timeout=30)
         logger.info(f"Response status code: {response.status_code}")
         
         if response.status_code == 404:
@@ -369,75 +339,56 @@ def test_invalid_session_id():
         return False
 
 
+# Tests keyed by their summary label. The error cases use hardcoded session
+# values, so none of them wait on the valid request's session being created.
+TESTS = {
+    "Valid request": test_session_stop_endpoint,
+    "Invalid API key": test_invalid_api_key,
+    "Missing API key": test_missing_api_key,
+    "Missing session_id": test_missing_session_id,
+    "Missing session token": test_missing_session_token,
+    "Invalid session_id": test_invalid_session_id,
+}
+
+
+def run_test(name):
+    """Run one test on a thread named after it, so its log lines can be told apart"""
+    threading.current_thread().name = name
+    return TESTS[name]()
+
+
 def main():
     """Run all tests"""
-    logger.info("=" * 60)
-    logger.info("SESSION STOP ENDPOINT TEST (LOCAL)")
-    logger.info("=" * 60)
-    logger.info("NOTE: Make sure session_test_receiver.py is running on port 8764")
-    logger.info("=" * 60)
-    
-    # Test 1: Valid request
-    logger.info("\n" + "="*50)
-    logger.info("Test 1: Valid stop session request")
-    logger.info("="*50)
-    
-    success1 = test_session_stop_endpoint()
-    
-    # Test 2: Invalid API key
-    logger.info("\n" + "="*50)
-    logger.info("Test 2: Invalid API key")
-    logger.info("="*50)
-    
-    success2 = test_invalid_api_key()
-    
-    # Test 3: Missing API key
-    logger.info("\n" + "="*50)
-    logger.info("Test 3: Missing API key header")
-    logger.info("="*50)
-    
-    success3 = test_missing_api_key()
-    
-    # Test 4: Missing session_id
-    logger.info("\n" + "="*50)
-    logger.info("Test 4: Missing session_id")
-    logger.info("="*50)
-    
-    success4 = test_missing_session_id()
-    
-    # Test 5: Missing session token
-    logger.info("\n" + "="*50)
-    logger.info("Test 5: Missing session token")
-    logger.info("="*50)
+    try:
+        logger.info("=" * 60)
+        logger.info("SESSION STOP ENDPOINT TEST (LOCAL)")
+        logger.info("=" * 60)
+        logger.info("NOTE: Make sure session_test_receiver.py is running on port 8764")
+        logger.info("=" * 60)
     
-    success5 = test_missing_session_token()
+        # All tests are independent, so run them concurrently over the shared Session
+        logger.info(f"Running {len(TESTS)} tests concurrently...")
     
-    # Test 6: Invalid session_id
-    logger.info("\n" + "="*50)
-    logger.info("Test 6: Invalid session_id")
-    logger.info("="*50)
+        with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+            results = list(executor.map(run_test, TESTS))
     
-    success6 = test_invalid_session_id()
+        # Summary
+        logger.info("\n" + "="*50)
+        logger.info("TEST SUMMARY")
+        logger.info("="*50)
     
-    # Summary
-    logger.info("\n" + "="*50)
-    logger.info("TEST SUMMARY")
-    logger.info("="*50)
+        for name, success in zip(TESTS, results):
+            logger.info(f"{name} test: {'✅ PASSED' if success else '❌ FAILED'}")
     
-    logger.info(f"Valid request test: {'✅ PASSED' if success1 else '❌ FAILED'}")
-    logger.info(f"Invalid API key test: {'✅ PASSED' if success2 else '❌ FAILED'}")
-    logger.info(f"Missing API key test: {'✅ PASSED' if success3 else '❌ FAILED'}")
-    logger.info(f"Missing session_id test: {'✅ PASSED' if success4 else '❌ FAILED'}")
-    logger.info(f"Missing session token test: {'✅ PASSED' if success5 else '❌ FAILED'}")
-    logger.info(f"Invalid session_id test: {'✅ PASSED' if success6 else '❌ FAILED'}")
+        total_passed = sum(results)
+        logger.info(f"\nOverall: {total_passed}/{len(TESTS)} tests passed")
     
-    total_passed = sum([success1, success2, success3, success4, success5, success6])
-    logger.info(f"\nOverall: {total_passed}/6 tests passed")
-    
-    if total_passed == 6:
-        logger.info("🎉 All tests passed!")
-    else:
-        logger.info("⚠️ Some tests failed. Check the logs above for details.")
+        if total_passed == len(TESTS):
+            logger.info("🎉 All tests passed!")
+        else:
+            logger.info("⚠️ Some tests failed. Check the logs above for details.")
+    finally:
+        SESSION.close()
 
 
 if __name__ == "__main__":
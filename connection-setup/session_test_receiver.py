@@ -31,10 +31,11 @@ def get_server_hostname():
     try:
         # Try to get the actual hostname
         hostname = socket.gethostname()
-        # Get the IP address associated with the hostname
-        local_ip = socket.gethostbyname(hostname)
-        return hostname if hostname != 'localhost' else local_ip
-    except:
+        if hostname != 'localhost':
+            return hostname
+        # Only a bare "localhost" needs a lookup, so the common path never blocks on DNS
+        return socket.gethostbyname(hostname)
+    except OSError:
         return "localhost"
 
 
@@ -6,9 +6,32 @@ import wave
 import websockets
 import logging
 import ssl
+import struct
 import sys
 import time
 
+try:
+    # orjson serializes the large base64 "audio" strings much faster than the json module
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+    
+    json_dumpb = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+    def json_dumpb(obj):
+        return json.dumps(obj).encode()
+
+try:
+    # libuv-based event loop, a drop-in replacement with lower scheduling overhead
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configuration fields
 WEBSOCKET_ADDRESS = "ws://oai.agora.io:8765"  # For testing with local receiver
 # WEBSOCKET_ADDRESS = "wss://api.example.com/v1/websocket"  # Production URL
@@ -19,11 +42,20 @@ CHANNEL = "test_channel"
 UID = "200"
 ENABLE_STRING_UID = False
 AVATAR_ID = "test_avatar_123"
+SEND_BINARY_AUDIO = False  # Send raw PCM as binary voice frames instead of base64 JSON (see README)
+SEND_JSON_AS_BINARY = False  # Send JSON commands as binary frames so the server skips UTF-8 validation (see README)
+
+# Binary voice frames: 1-byte tag + uint32 little-endian sample rate, followed by raw PCM16
+VOICE_FRAME_TAG = b"V"
+VOICE_FRAME_HEADER = struct.Struct("<cI")
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# JSON commands go out as text frames by default, or as UTF-8 bytes in binary frames
+encode_message = json_dumpb if SEND_JSON_AS_BINARY else json_dumps
+
 
 class WebSocketAudioSender:
     def __init__(self, wav_file="input.wav"):
@@ -39,9 +71,11 @@ class WebSocketAudioSender:
             
             # Use extra_headers for WebSocket authentication (websockets 10.4)
             headers = {"authorization": f"Bearer {SESSION_TOKEN}"}
+            # Audio barely compresses, so skip permessage-deflate on every frame
             self.websocket = await websockets.connect(
                 WEBSOCKET_ADDRESS,
-                extra_headers=headers
+                extra_headers=headers,
+                compression=None
             )
             logger.info("WebSocket connected successfully")
             
@@ -63,7 +97,7 @@ class WebSocketAudioSender:
             }
             
             # Send initial configuration payload
-            await self.websocket.send(json.dumps(payload))
+            await self.websocket.send(encode_message(payload))
             logger.info("Sent initial configuration payload with 'init' command")
             
             # Start listening for messages in background
@@ -98,7 +132,7 @@ class WebSocketAudioSender:
         """Listen for incoming WebSocket messages"""
         try:
             async for message in self.websocket:
-                data = json.loads(message)
+                data = json_loads(message)
                 logger.info(f"Received message: {data}")
         except Exception as e:
             logger.error(f"Error listening to messages: {e}")
@@ -136,25 +170,36 @@ class WebSocketAudioSender:
                     if not chunk:
                         break
                     
-                    # Encode chunk to base64
-                    base64_audio = base64.b64encode(chunk).decode('utf-8')
-                    event_id = str(uuid.uuid4())
-                    
-                    # Create message with specified format
-                    msg = {
-                        "command": "voice",
-                        "audio": base64_audio,
-                        "sampleRate": sr,  # Use actual sample rate from WAV file
-                        "encoding": "PCM16",
-                        "event_id": event_id
-                    }
+                    if SEND_BINARY_AUDIO:
+                        # Raw PCM behind a small header, no base64 or JSON encoding
+                        event_id = None
+                        message = VOICE_FRAME_HEADER.pack(VOICE_FRAME_TAG, sr) + chunk
+                    else:
+                        # Encode chunk to base64
+                        base64_audio = base64.b64encode(chunk).decode('utf-8')
+                        event_id = str(uuid.uuid4())
+                        
+                        # Create message with specified format
+                        msg = {
+                            "command": "voice",
+                            "audio": base64_audio,
+                            "sampleRate": sr,  # Use actual sample rate from WAV file
+                            "encoding": "PCM16",
+                            "event_id": event_id
+                        }
+                        
+                        message = encode_message(msg)
                     
                     # Send chunk with retry logic
                     for attempt in range(3):
                         try:
-                            await self.websocket.send(json.dumps(msg))
+                            await self.websocket.send(message)
                             chunk_count += 1
-                            logger.info(f"Sent audio chunk {chunk_count}, event_id: {event_id}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Sent audio chunk %d, event_id: %s", chunk_count, event_id)
+                            # Log every 50 chunks to reduce verbosity
+                            if chunk_count % 50 == 0:
+                                logger.info("Sent %d audio chunks", chunk_count)
                             break
                         except Exception as e:
                             if attempt == 2:
@@ -180,7 +225,7 @@ class WebSocketAudioSender:
         }
         
         try:
-            await self.websocket.send(json.dumps(msg))
+            await self.websocket.send(encode_message(msg))
             logger.info(f"Sent voice_end command, event_id: {event_id}")
         except Exception as e:
             logger.error(f"Error sending voice_end: {e}")
@@ -197,7 +242,7 @@ class WebSocketAudioSender:
         }
         
         try:
-            await self.websocket.send(json.dumps(msg))
+            await self.websocket.send(encode_message(msg))
             logger.info(f"Sent heartbeat, event_id: {event_id}, timestamp: {timestamp}")
         except Exception as e:
             logger.error(f"Error sending heartbeat: {e}")
@@ -240,4 +285,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
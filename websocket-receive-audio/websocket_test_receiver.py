@@ -1,15 +1,61 @@
 import asyncio
-import base64
+import hmac
 import json
 import logging
-import wave
+import multiprocessing
+import os
+import queue
 import socket
+import struct
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import BinaryIO, Optional
 import websockets
 
+try:
+    # orjson's C parser is much faster on the large base64 "audio" strings in voice
+    # frames. Its JSONDecodeError subclasses json.JSONDecodeError.
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+try:
+    # SIMD-accelerated (AVX2/SSSE3/NEON) base64 decoder, several times faster on audio chunks
+    from pybase64 import b64decode
+except ImportError:
+    from binascii import a2b_base64 as b64decode
+
+try:
+    # libuv-based event loop, a drop-in replacement with lower per-frame overhead
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configuration
 WEBSOCKET_PORT = 8765
-OUTPUT_WAV_FILE = "received_audio.wav"
+# Output name per session; pid and client_id keep concurrent sessions and workers apart
+OUTPUT_WAV_FILE = "received_audio_{timestamp}_{pid}_{client_id}.wav"
+# Worker processes sharing the port via SO_REUSEPORT (Linux); each gets its own event loop and GIL
+WORKER_PROCESSES = int(os.environ.get("RECEIVER_WORKERS", "1"))
+AUDIO_BUFFER_SIZE = 512 * 1024  # ~10s of 24kHz PCM16, flushed to the WAV file when full
+WRITE_QUEUE_SIZE = 256  # Pending file operations for the writer thread
+SEND_QUEUE_SIZE = 32  # Pending replies per connection; more are dropped if the client stops reading
+
+# Binary voice frames: 1-byte tag + uint32 little-endian sample rate, followed by raw PCM16
+VOICE_FRAME_TAG = b"V"
+VOICE_FRAME_HEADER = struct.Struct("<cI")
+
+# 44-byte canonical WAV header; the RIFF and data chunk sizes are patched when the file is closed
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_RIFF_SIZE_OFFSET = 4
+WAV_DATA_SIZE_OFFSET = 40
+WAV_SIZE_FIELD = struct.Struct("<I")
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -19,29 +65,91 @@ def get_server_hostname():
     """Get the server's hostname or IP address"""
     try:
         hostname = socket.gethostname()
-        local_ip = socket.gethostbyname(hostname)
-        return hostname if hostname != 'localhost' else local_ip
-    except:
+        if hostname != 'localhost':
+            return hostname
+        # Only a bare "localhost" needs a lookup, so the common path never blocks on DNS
+        return socket.gethostbyname(hostname)
+    except OSError:
         return "localhost"
 
+def create_listen_socket(reuse_port=False):
+    """Create the server's listening socket with its options set before it starts listening"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            # Each worker binds its own socket to the shared port and the kernel spreads connections
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        # Inherited by accepted connections, so the kernel detects dead peers
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.bind(("0.0.0.0", WEBSOCKET_PORT))
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+# websockets.serve is the legacy implementation before websockets 14 and the new
+# asyncio one afterwards; resolve where the handshake headers live just once
+if websockets.serve.__module__.startswith("websockets.legacy"):
+    def get_request_headers(websocket):
+        return websocket.request_headers
+else:
+    def get_request_headers(websocket):
+        return websocket.request.headers
+
+@dataclass
+class ClientState:
+    """Per-connection state shared by the command handlers"""
+    client_id: str
+    chunk_count: int = 0
+    session_initialized: bool = False
+    current_sample_rate: int = 48000
+    unknown_command_logged: bool = False
+    # Outgoing messages, sent by a per-connection writer task so handlers never block on sends
+    send_queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=SEND_QUEUE_SIZE))
+    # This session's WAV file and the write buffer it fills, taken from the receiver's pool
+    audio_file: Optional[BinaryIO] = None
+    total_bytes: int = 0
+    audio_buffer: Optional[bytearray] = None
+    audio_view: Optional[memoryview] = None
+    audio_buffered: int = 0
+    # File operations waiting for room in the write queue, handed over by the receive loop
+    pending_writes: list = field(default_factory=list)
+
 class WebSocketTestReceiver:
     EXPECTED_SESSION_TOKEN = "test_session_token_12345"
+    # Encoded once here rather than on every connection
+    _EXPECTED_AUTH = f"Bearer {EXPECTED_SESSION_TOKEN}".encode()
     
     def __init__(self):
         self.connection_count = 0
-        self._audio_file = None
-        self._total_bytes = 0
+        # File writes run on a dedicated thread so a stalled disk never blocks the event loop
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        # Preallocated write buffers shared by all sessions: a full buffer is handed to the writer
+        # thread as-is and comes back through this pool once written, so flushing neither copies
+        # nor allocates
+        self._free_buffers = queue.SimpleQueue()
+        # Command name -> handler, so each frame is dispatched with one dict lookup. Handlers are
+        # plain methods (replies go through the send queue), so no coroutine is created per frame
+        self._handlers = {
+            "init": self._on_init,
+            "voice": self._on_voice,
+            "voice_end": self._on_voice_end,
+            "voice_interrupt": self._on_voice_interrupt,
+            "heartbeat": self._on_heartbeat,
+            "special": self._on_special,
+        }
         
     def _validate_session_token(self, websocket):
         """Validate the session token from WebSocket headers"""
         try:
-            headers = getattr(websocket, 'request_headers', None) or getattr(websocket, 'request', {}).get('headers', {})
-            if headers:
-                auth_header = headers.get("authorization", "")
-                expected_header = f"Bearer {self.EXPECTED_SESSION_TOKEN}"
-                if auth_header == expected_header:
-                    return True
-                logger.warning(f"Invalid token: {auth_header}")
+            auth_header = get_request_headers(websocket).get("authorization", "")
+            # Constant-time comparison so the token can't be probed via response timing
+            if hmac.compare_digest(auth_header.encode(), self._EXPECTED_AUTH):
+                return True
+            logger.warning(f"Invalid token: {auth_header}")
             return False
         except Exception as e:
             logger.error(f"Token validation error: {e}")
@@ -59,120 +167,301 @@ class WebSocketTestReceiver:
             await websocket.close(code=1008, reason="Invalid session token")
             return
         
-        chunk_count = 0
-        audio_data_buffer = []
-        session_initialized = False
-        current_sample_rate = 48000
+        state = ClientState(client_id)
+        # Bound once per connection so the receive loop only touches locals
+        get_handler = self._handlers.get
+        on_unknown = self._on_unknown
+        on_voice_frame = self._on_voice_frame
+        writer = asyncio.create_task(self._send_loop(websocket, state.send_queue))
         
         try:
             async for message in websocket:
+                if state.pending_writes:
+                    # The disk is behind: stop reading from this client until its writes are queued
+                    await self._drain_pending_writes(state)
                 try:
-                    data = json.loads(message)
-                    command = data.get("command")
-                    
-                    if command == "init":
-                        session_id = data.get('session_id')
-                        logger.info(f"Session initialized: {client_id} ({session_id})")
-                        session_initialized = True
-                        # Initialize audio file when session starts
-                        self.init_audio_file(current_sample_rate)
-                        
-                    elif command == "voice":
-                        if not session_initialized:
+                    if isinstance(message, bytes):
+                        # Binary frames carry raw PCM, skipping base64 and JSON entirely
+                        if message[:1] == VOICE_FRAME_TAG:
+                            on_voice_frame(message, state)
                             continue
-                        
-                        chunk_count += 1
-                        sample_rate = data.get("sampleRate", 48000)
-                        current_sample_rate = sample_rate
-                        
-                        # Log every 50 chunks to reduce verbosity
-                        if chunk_count % 50 == 0:
-                            logger.info(f"Received {chunk_count} audio chunks from {client_id}")
-                        
-                        audio_base64 = data.get("audio", "")
-                        if audio_base64:
-                            audio_bytes = base64.b64decode(audio_base64)
-                            audio_data_buffer.append(audio_bytes)
-                            # Write each chunk immediately to file
-                            self.write_audio_chunk(audio_bytes, current_sample_rate)
-                    
-                    elif command == "voice_end":
-                        logger.info(f"Voice ended: {client_id}, {len(audio_data_buffer)} chunks")
-                    
-                    elif command == "voice_interrupt":
-                        logger.info(f"Voice interrupted: {client_id}")
-                        # Just log, no other action
+                        # Otherwise it's JSON sent as a binary frame, which websockets hands over
+                        # without UTF-8 validation or a str copy; json_loads accepts bytes directly
                     
-                    elif command == "heartbeat":
-                        pass  # Silent heartbeat handling
+                    data = json_loads(message)
+                    # Every well-formed message has a command, so index directly rather than .get()
+                    try:
+                        command = data["command"]
+                    except KeyError:
+                        command = None
+                    get_handler(command, on_unknown)(data, state)
                         
                 except json.JSONDecodeError:
-                    logger.error(f"JSON decode error from {client_id}")
+                    logger.error("JSON decode error from %s", client_id)
                 except Exception as e:
-                    logger.error(f"Message processing error: {e}")
+                    logger.error("Message processing error: %s", e)
             
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"Connection closed: {client_id}")
         except Exception as e:
             logger.error(f"Client error: {e}")
         finally:
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+            
             # Close the audio file
-            if hasattr(self, '_audio_file'):
-                self._audio_file.close()
+            if state.audio_file is not None:
+                self.close_audio_file(state)
+                if state.pending_writes:
+                    await self._drain_pending_writes(state)
                 logger.info(f"Audio file closed for {client_id}")
             
-            logger.info(f"Client {client_id} disconnected. Total chunks: {chunk_count}")
+            logger.info(f"Client {client_id} disconnected. Total chunks: {state.chunk_count}")
     
-    def init_audio_file(self, sample_rate):
-        """Initialize a new audio file for writing"""
+    async def _send_loop(self, websocket, send_queue):
+        """Send queued outgoing messages until the connection closes"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"received_audio_{timestamp}.wav"
+            while True:
+                await websocket.send(await send_queue.get())
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.error(f"Send error: {e}")
+    
+    def _on_init(self, data, state):
+        """Mark the session as initialized"""
+        session_id = data.get('session_id')
+        logger.info(f"Session initialized: {state.client_id} ({session_id})")
+        state.session_initialized = True
+        # The audio file is opened on the first voice chunk, once its sample rate is known
+    
+    def _on_voice(self, data, state):
+        """Decode a base64 voice command and stream it to the audio file"""
+        if not state.session_initialized:
+            return
+        
+        # Runs for every audio chunk, so bind lookups to locals
+        get = data.get
+        state.chunk_count += 1
+        
+        audio_base64 = get("audio", "")
+        if audio_base64:
+            # The sample rate doesn't change mid-stream, so it's only read to open the file
+            if state.audio_file is None:
+                state.current_sample_rate = get("sampleRate", 48000)
+                self.init_audio_file(state, state.current_sample_rate)
+            audio_bytes = b64decode(audio_base64)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("chunk %d eid=%s sr=%d enc=%s sz=%d", state.chunk_count, get("event_id"),
+                             state.current_sample_rate, get("encoding"), len(audio_bytes))
+            # Stream each chunk to the file through the write buffer
+            self.write_audio_chunk(state, audio_bytes)
+        
+        self._log_chunk_progress(state)
+    
+    def _on_voice_frame(self, message, state):
+        """Stream a binary voice frame (VOICE_FRAME_HEADER + raw PCM) to the audio file"""
+        if not state.session_initialized:
+            return
+        
+        state.chunk_count += 1
+        audio_bytes = memoryview(message)[VOICE_FRAME_HEADER.size:]
+        
+        if audio_bytes:
+            if state.audio_file is None:
+                _, state.current_sample_rate = VOICE_FRAME_HEADER.unpack_from(message)
+                self.init_audio_file(state, state.current_sample_rate)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("chunk %d binary sr=%d sz=%d", state.chunk_count, state.current_sample_rate, len(audio_bytes))
+            self.write_audio_chunk(state, audio_bytes)
+        
+        self._log_chunk_progress(state)
+    
+    def _log_chunk_progress(self, state):
+        """Log every 50 chunks to reduce verbosity"""
+        if state.chunk_count % 50 == 0:
+            logger.info("Received %d audio chunks from %s", state.chunk_count, state.client_id)
+    
+    def _on_voice_end(self, data, state):
+        logger.info("Voice ended: %s, %d chunks", state.client_id, state.chunk_count)
+    
+    def _on_voice_interrupt(self, data, state):
+        logger.info("Voice interrupted: %s", state.client_id)
+        # Just log, no other action
+    
+    def _on_heartbeat(self, data, state):
+        try:
+            state.send_queue.put_nowait(json_dumps({
+                "command": "heartbeat_ack",
+                "event_id": data.get("event_id"),
+                "timestamp": data.get("timestamp")
+            }))
+        except asyncio.QueueFull:
+            # The client isn't reading its replies; acks are optional, so drop rather than buffer
+            logger.warning("Send queue full, dropping heartbeat_ack for %s", state.client_id)
+    
+    def _on_special(self, data, state):
+        logger.info("Special command from %s: %s", state.client_id, data.get('content'))
+    
+    def _on_unknown(self, data, state):
+        """Ignore unrecognized messages, warning only once per connection"""
+        if state.unknown_command_logged:
+            return
+        state.unknown_command_logged = True
+        logger.warning("Ignoring unknown command from %s: %s", state.client_id, data.get('command'))
+    
+    def init_audio_file(self, state, sample_rate):
+        """Initialize a new audio file for this session"""
+        try:
+            # The header stores the rate and byte rate (rate * 2) as uint32, so check it fits
+            # before touching the disk
+            sample_rate = int(sample_rate)
+            if not 0 < sample_rate < 2**31:
+                raise ValueError(f"sample rate out of range: {sample_rate}")
+            header = WAV_HEADER.pack(
+                b"RIFF", 0, b"WAVE",
+                b"fmt ", 16, 1,  # PCM format chunk
+                1,  # Mono
+                sample_rate, sample_rate * 2,  # Sample rate, byte rate
+                2, 16,  # Block align, 16-bit PCM
+                b"data", 0
+            )
+            
+            filename = OUTPUT_WAV_FILE.format(
+                timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"),
+                pid=os.getpid(),
+                client_id=state.client_id
+            )
+            
+            # Plain file with the header written once up front, so appending PCM is a bare
+            # write() with none of wave's per-call header bookkeeping. Default buffering is
+            # deliberate: audio arrives in AUDIO_BUFFER_SIZE blocks, which are larger than the
+            # file's own buffer and so go straight to the write syscall without a copy
+            audio_file = open(filename, 'wb')
+            try:
+                audio_file.write(header)
+            except Exception:
+                audio_file.close()
+                raise
             
-            self._audio_file = wave.open(filename, 'wb')
-            self._audio_file.setnchannels(1)  # Mono
-            self._audio_file.setsampwidth(2)  # 16-bit PCM
-            self._audio_file.setframerate(sample_rate)
-            self._total_bytes = 0
+            # Only a fully initialized file is attached to the session
+            state.audio_file = audio_file
+            state.total_bytes = 0
+            self._take_audio_buffer(state)
             
             logger.info(f"Audio file initialized: {filename}")
             
         except Exception as e:
             logger.error(f"Error initializing audio file: {e}")
     
-    def write_audio_chunk(self, audio_bytes, sample_rate):
-        """Write audio chunk directly to file"""
+    def write_audio_chunk(self, state, audio_bytes):
+        """Copy audio chunk into the session's write buffer, flushing it to file when full"""
         try:
-            if not self._audio_file:
-                self.init_audio_file(sample_rate)
+            if state.audio_file is None:
+                # init_audio_file failed and has already logged why
+                return
             
-            self._audio_file.writeframes(audio_bytes)
-            self._total_bytes += len(audio_bytes)
+            size = len(audio_bytes)
+            if state.audio_buffered + size > AUDIO_BUFFER_SIZE:
+                self._flush_audio_buffer(state)
+            
+            if size > AUDIO_BUFFER_SIZE:
+                self._submit_write(state, state.audio_file.write, audio_bytes)
+            else:
+                end = state.audio_buffered + size
+                state.audio_view[state.audio_buffered:end] = audio_bytes
+                state.audio_buffered = end
+            state.total_bytes += size
             
         except Exception as e:
-            logger.error(f"Error writing audio chunk: {e}")
+            logger.error("Error writing audio chunk: %s", e)
+    
+    def _flush_audio_buffer(self, state):
+        """Write any buffered audio to the session's file"""
+        if state.audio_buffered:
+            self._submit_write(state, self._write_audio_buffer, state.audio_file, state.audio_buffer, state.audio_buffered)
+            self._take_audio_buffer(state)
     
-    def save_audio(self, audio_chunks, sample_rate=48000, suffix=""):
-        """Save received audio chunks to a WAV file"""
+    def _take_audio_buffer(self, state):
+        """Give the session a free write buffer, allocating one only if all are in use"""
         try:
-            combined_audio = b''.join(audio_chunks)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"received_audio_{timestamp}{suffix}.wav"
-            
-            with wave.open(filename, 'wb') as wf:
-                wf.setnchannels(1)  # Mono
-                wf.setsampwidth(2)  # 16-bit PCM
-                wf.setframerate(sample_rate)
-                wf.writeframes(combined_audio)
-            
-            duration = len(combined_audio) / (sample_rate * 2)
-            logger.info(f"Audio saved: {filename} ({duration:.2f}s, {len(combined_audio)} bytes)")
-            
+            state.audio_buffer = self._free_buffers.get_nowait()
+        except queue.Empty:
+            state.audio_buffer = bytearray(AUDIO_BUFFER_SIZE)
+        state.audio_view = memoryview(state.audio_buffer)
+        state.audio_buffered = 0
+    
+    def _write_audio_buffer(self, audio_file, buffer, size):
+        """Write a filled buffer without copying and return it to the pool (runs on the writer thread)"""
+        try:
+            with memoryview(buffer) as view:
+                audio_file.write(view[:size])
+        finally:
+            self._free_buffers.put(buffer)
+    
+    def close_audio_file(self, state):
+        """Flush the session's buffered audio and queue its file to be finalized"""
+        try:
+            if state.audio_buffered:
+                # The writer thread returns the buffer to the pool once it's written
+                self._submit_write(state, self._write_audio_buffer, state.audio_file, state.audio_buffer, state.audio_buffered)
+            elif state.audio_buffer is not None:
+                self._free_buffers.put(state.audio_buffer)
+            self._submit_write(state, self._finalize_audio_file, state.audio_file, state.total_bytes)
+        finally:
+            state.audio_file = None
+            state.audio_buffer = state.audio_view = None
+            state.audio_buffered = 0
+    
+    @staticmethod
+    def _finalize_audio_file(audio_file, total_bytes):
+        """Patch the WAV header sizes and close the file (runs on the writer thread)"""
+        try:
+            audio_file.seek(WAV_RIFF_SIZE_OFFSET)
+            audio_file.write(WAV_SIZE_FIELD.pack(36 + total_bytes))
+            audio_file.seek(WAV_DATA_SIZE_OFFSET)
+            audio_file.write(WAV_SIZE_FIELD.pack(total_bytes))
         except Exception as e:
-            logger.error(f"Save error: {e}")
+            logger.error(f"Error closing audio file: {e}")
+        finally:
+            audio_file.close()
+    
+    def _submit_write(self, state, func, *args):
+        """Queue a file operation for the writer thread, parking it on the session if the queue is full"""
+        job = (func, args)
+        if not state.pending_writes:
+            try:
+                self._write_queue.put_nowait(job)
+                return
+            except queue.Full:
+                # Only when the disk is far behind; never block the event loop waiting for room
+                logger.warning("Audio write queue full, pausing %s", state.client_id)
+        # Behind any already parked jobs, so this session's writes stay in order
+        state.pending_writes.append(job)
+    
+    async def _drain_pending_writes(self, state):
+        """Wait in a worker thread for room in the write queue, applying backpressure to one session only"""
+        pending = state.pending_writes
+        while pending:
+            await asyncio.to_thread(self._write_queue.put, pending.pop(0))
     
-    async def start_server(self):
-        """Start the WebSocket server"""
+    def _writer_loop(self):
+        """Run queued file operations in order until the None sentinel arrives"""
+        while True:
+            job = self._write_queue.get()
+            if job is None:
+                break
+            func, args = job
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("Error writing audio file: %s", e)
+    
+    async def start_server(self, sock=None):
+        """Start the WebSocket server, on the given listening socket if one is passed"""
         hostname = get_server_hostname()
         
         logger.info("WebSocket Test Receiver Starting...")
@@ -181,16 +470,61 @@ class WebSocketTestReceiver:
         logger.info(f"Audio output: timestamped WAV files")
         logger.info("Press Ctrl+C to stop")
         
-        async with websockets.serve(self.handle_client, "0.0.0.0", WEBSOCKET_PORT):
-            logger.info("Server ready, waiting for connections...")
+        self._writer_thread.start()
+        try:
+            await self._serve(sock if sock is not None else create_listen_socket())
+        finally:
+            # Let the writer drain everything queued so far, then stop it
+            self._write_queue.put(None)
+            self._writer_thread.join()
+    
+    async def _serve(self, sock):
+        """Serve WebSocket connections on sock until cancelled"""
+        # Voice frames carry base64 or raw PCM, which barely compresses, so
+        # permessage-deflate would only burn CPU on every frame. max_size is raised
+        # above the 1 MiB default so large audio chunks are not rejected.
+        async with websockets.serve(
+            self.handle_client,
+            sock=sock,
+            compression=None,
+            max_size=16 * 1024 * 1024,
+            max_queue=64,
+            ping_interval=20,
+            ping_timeout=20,
+            write_limit=2**20
+        ):
+            # asyncio already sets TCP_NODELAY on every connection, so small frames go out
+            # immediately. For production deploys, also consider
+            # `sysctl -w net.ipv4.tcp_slow_start_after_idle=0` so the congestion window
+            # isn't reset between bursts of speech.
+            logger.info(f"Server ready (pid {os.getpid()}), waiting for connections...")
             await asyncio.Future()
 
-async def main():
+async def main(reuse_port=False):
     receiver = WebSocketTestReceiver()
-    await receiver.start_server()
+    await receiver.start_server(create_listen_socket(reuse_port))
 
-if __name__ == "__main__":
+def run_server(reuse_port=False):
+    """Run one receiver process until interrupted"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
-        asyncio.run(main())
+        asyncio.run(main(reuse_port))
     except KeyboardInterrupt:
         logger.info("Server stopped")
+
+if __name__ == "__main__":
+    if WORKER_PROCESSES > 1:
+        # The kernel load-balances incoming connections across the workers' sockets
+        workers = [multiprocessing.Process(target=run_server, args=(True,)) for _ in range(WORKER_PROCESSES)]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            # Ctrl+C reaches every worker through the process group; wait for them to exit
+            for worker in workers:
+                worker.join()
+    else:
+        run_server()